@@ -1,9 +1,8 @@
 import logging
 import time
-from typing import Iterable, List, Optional, Mapping
+from typing import Any, Iterable, List, Optional, Mapping, Tuple
 import sys
 
-import tests.blender_lib as bl
 from tests.process import BlenderServer
 
 logging.basicConfig(stream=sys.stderr, level=logging.WARNING)
@@ -97,7 +96,15 @@ class BlenderApp:
         self._log_level = log_level
 
     def setup(self, blender_args: List = None, env: Optional[Mapping[str, str]] = None):
+        self.start(blender_args, env)
+        self.connect()
+
+    def start(self, blender_args: List = None, env: Optional[Mapping[str, str]] = None):
+        """Start the Blender process, without waiting for its python server"""
         self._blender.start(blender_args, env)
+
+    def connect(self):
+        """Connect to the python server of the started Blender"""
         self._blender.connect()
 
     def connect_mixer(self):
@@ -161,12 +168,16 @@ class BlenderApp:
         self._blender.send_function(f, *args, **kwargs)
         time.sleep(1)
 
+    def send_functions(self, calls: Iterable[Tuple[Any, ...]]):
+        self._blender.send_functions(calls)
+        time.sleep(1)
+
     def send_string(self, s, sleep: float):
         self._blender.send_string(s)
         time.sleep(sleep)
 
     def quit(self):
-        self._blender.send_function(bl.quit)
+        self._blender.quit()
 
     def close(self):
         self._blender.close()
@@ -22,6 +22,9 @@ from mixer.blender_data.types import Soa
 logging.basicConfig(stream=sys.stderr, level=logging.WARNING)
 logger = logging.getLogger(__name__)
 
+# Time allowed to a Blender to exit after the quit script before it is killed
+_quit_timeout = 5.0
+
 
 @dataclass
 class BlenderDesc:
@@ -101,9 +104,10 @@ class MixerTestCase(unittest.TestCase):
             # start a broadcaster server
             self._server_process.start(server_args=server_args)
 
-            # start all the blenders
+            # start all the blenders first, so that they load concurrently
             window_width = int(1920 / len(blenderdescs))
 
+            started = []
             for i, blenderdesc in enumerate(blenderdescs):
                 shared_folders = self.shared_folders[i] if i < len(self.shared_folders) else []
                 if not isinstance(shared_folders, (list, tuple)):
@@ -115,7 +119,13 @@ class MixerTestCase(unittest.TestCase):
                     args.append(str(blenderdesc.load_file))
                 blender = BlenderApp(python_port + i, ptvsd_port + i, blenderdesc.wait_for_debugger)
                 blender.set_log_level(self._log_level)
-                blender.setup(args)
+                blender.start(args)
+                self._blenders.append(blender)
+                started.append((blender, shared_folders))
+
+            # then connect them in order, since the first one creates the room
+            for i, (blender, shared_folders) in enumerate(started):
+                blender.connect()
                 if join:
                     blender.connect_mixer()
                     if i == 0:
@@ -123,8 +133,6 @@ class MixerTestCase(unittest.TestCase):
                     else:
                         blender.join_room(vrtist_protocol=self.vrtist_protocol, shared_folders=shared_folders)
 
-                self._blenders.append(blender)
-
             # join_room waits for the room to be joinable before issuing join room, but it
             # cannot wait for the reception of the room contents
             time.sleep(10 * self.latency)
@@ -139,16 +147,23 @@ class MixerTestCase(unittest.TestCase):
         super().tearDown()
 
     def shutdown(self):
-        # quit and wait
+        # quit all, then wait, so that the blenders exit concurrently
         for blender in self._blenders:
             try:
                 blender.quit()
-                blender.wait()
-                blender.close()
             except Exception:
                 # always close server
                 pass
 
+        for blender in self._blenders:
+            try:
+                if blender.wait(_quit_timeout) is None:
+                    # the quit script was not received or Blender hangs on exit
+                    blender.kill()
+                blender.close()
+            except Exception:
+                pass
+
         self._server_process.kill()
         mixer.codec.unregister()
 
@@ -288,7 +303,7 @@ class MixerTestCase(unittest.TestCase):
                 continue
 
             message_name = str(MessageType(message_type))
-            logger.info(f"Message count for {message_name:16} : {len_a}")
+            logger.info("Message count for %-16s : %s", message_name, len_a)
 
             # Equality tests required to handle float comparison.
             # This prevents us from using raw buffer comparison if they contain floats,
@@ -1,3 +1,4 @@
+import functools
 import inspect
 import logging
 import os
@@ -6,7 +7,7 @@ import socket
 import subprocess
 import sys
 import time
-from typing import Any, Callable, Iterable, List, Mapping, Optional
+from typing import Any, Callable, Iterable, List, Mapping, Optional, Tuple
 
 import tests.blender_lib as blender_lib
 
@@ -52,6 +53,16 @@ if os.getenv("CI_RUNNER_VERSION"):
 else:
     _popen_redirect = {}
 
+# Each process gets its own console on Windows
+if os.name == "nt":
+    _popen_console = {"creationflags": subprocess.CREATE_NEW_CONSOLE}
+else:
+    _popen_console = {}
+
+# Maximum time for a script to be written to the Blender python server socket.
+# The write only blocks when Blender stops reading its socket (crash, hang)
+_send_timeout = 10.0
+
 
 def blender_exe_path() -> str:
     blender_exe = os.environ.get("MIXER_BLENDER_EXE_PATH")
@@ -60,6 +71,27 @@ def blender_exe_path() -> str:
     return blender_exe
 
 
+@functools.lru_cache(maxsize=256)
+def _function_source(f: Callable) -> str:
+    return inspect.getsource(f)
+
+
+def _function_call_source(f: Callable, *args, **kwargs) -> str:
+    """
+    Returns the source code of function f followed by a call to f with the provided arguments
+    """
+    src = _function_source(f)
+    kwargs_ = [f"{key}={repr(value)}" for key, value in kwargs.items()]
+    args_ = [f"{repr(arg)}" for arg in args]
+    args_.extend(kwargs_)
+    arg_string = ",".join(args_)
+    return f"{src}\n{f.__name__}({arg_string})\n"
+
+
+# sent on every test teardown
+_quit_script = _function_call_source(blender_lib.quit)
+
+
 class Process:
     """
     Simple wrapper around subprocess.Popen
@@ -71,10 +103,10 @@ class Process:
 
     def start(self, args, kwargs):
         logger.info("Running subprocess.Popen()")
-        logger.info(f"args:   {args}")
-        logger.info(f"kwargs: {kwargs}")
+        logger.info("args:   %s", args)
+        logger.info("kwargs: %s", kwargs)
         self.command_line = " ".join(args)
-        logger.info(f"command line: {self.command_line}")
+        logger.info("command line: %s", self.command_line)
         try:
             self._process = subprocess.Popen(args, **kwargs)
             logger.info("subprocess.popen: success")
@@ -130,10 +162,7 @@ class BlenderProcess(Process):
             "shell": False,
             "env": env,
         }
-        
-        if os.name == 'nt':
-            popen_kwargs["creationflags"] = subprocess.CREATE_NEW_CONSOLE
-
+        popen_kwargs.update(_popen_console)
         popen_kwargs.update(_popen_redirect)
         super().start(popen_args, popen_kwargs)
 
@@ -170,9 +199,7 @@ class BlenderServer(BlenderProcess):
         super().start(self._path, args, blender_args, env=env)
 
     def connect(self):
-        self._sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self._sock.setblocking(True)
-        connected = False
+        self._sock = None
 
         # anti-virus might delay if Blender is launched for the first time
         # allow time to attach debugger
@@ -182,20 +209,30 @@ class BlenderServer(BlenderProcess):
             max_wait = 20
 
         start = time.monotonic()
-        while not connected and time.monotonic() - start < max_wait:
+        delay = 0.05
+        while self._sock is None:
             try:
-                self._sock.connect(("127.0.0.1", self._port))
-                connected = True
-            except ConnectionRefusedError:
-                pass
-
-        if not connected:
-            message = (
-                f"Cannot connect to Blender at 127.0.0.1:{self._port} after {int(time.monotonic() - start)} seconds.\n"
-                + f"Command line was: {self.command_line}"
-            )
+                self._sock = socket.create_connection(("127.0.0.1", self._port), timeout=1.0)
+            except (ConnectionRefusedError, socket.timeout):
+                waited = time.monotonic() - start
+                if waited >= max_wait:
+                    message = (
+                        f"Cannot connect to Blender at 127.0.0.1:{self._port} after {int(waited)} seconds.\n"
+                        + f"Command line was: {self.command_line}"
+                    )
+                    raise RuntimeError(message) from None
+
+                # Blender is still starting, do not spin
+                time.sleep(delay)
+                delay = min(delay * 1.5, 0.5)
 
-            raise RuntimeError(message)
+        self._sock.setblocking(True)
+
+        # scripts are small, do not let Nagle delay them
+        self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        if not self._wait_for_debugger:
+            # fail the send_string() instead of hanging the test if Blender does not read the scripts
+            self._sock.settimeout(_send_timeout)
 
     def close(self):
         if self._sock is not None:
@@ -205,10 +242,9 @@ class BlenderServer(BlenderProcess):
         # ensure that Blender processes the scripts one by one,
         # otherwise they get buffered here on startup and Blender gets all the scripts at once before
         # the initial synchronization is done
+        # send the length prefix and the script with a single write, that cannot be partial
         buffer = script.encode("utf-8")
-        length_buffer = encode_int(len(buffer))
-        self._sock.send(length_buffer)
-        self._sock.send(buffer)
+        self._sock.sendall(encode_int(len(buffer)) + buffer)
 
     def send_function(self, f: Callable, *args, **kwargs):
         """
@@ -217,16 +253,18 @@ class BlenderServer(BlenderProcess):
         Extracts the source code from the function f.
         The def statement must not be indented (no local function)
         """
-        src = inspect.getsource(f)
-        kwargs_ = [f"{key}={repr(value)}" for key, value in kwargs.items()]
-        args_ = [f"{repr(arg)}" for arg in args]
-        args_.extend(kwargs_)
-        arg_string = "" if args_ is None else ",".join(args_)
-        source = f"{src}\n{f.__name__}({arg_string})\n"
-        self.send_string(source)
+        self.send_string(_function_call_source(f, *args, **kwargs))
+
+    def send_functions(self, calls: Iterable[Tuple[Any, ...]]):
+        """
+        Remotely execute several functions with a single script.
+
+        Each item of calls is a tuple (f, *args), with the same restrictions on f as send_function()
+        """
+        self.send_string("".join(_function_call_source(f, *args) for f, *args in calls))
 
     def quit(self):
-        self.send_function(blender_lib.quit)
+        self.send_string(_quit_script)
 
 
 class PythonProcess(Process):
@@ -244,7 +282,7 @@ class PythonProcess(Process):
                 f"Expected one {python_exe_name} from Blender at {blender_exe}, found {len(python_paths)} : {python_paths}. Configure MIXER_BLENDER_EXE_PATH"
             )
         self._python_path = str(python_paths[0])
-        logger.info(f"Using python : {self._python_path}")
+        logger.info("Using python : %s", self._python_path)
 
     def start(self, args: Optional[Iterable[Any]] = ()) -> str:
         popen_args = [self._python_path]
@@ -255,11 +293,7 @@ class PythonProcess(Process):
         popen_kwargs = {
             "shell": False,
         }
-        
-        # Only add this flag if the OS is Windows
-        if os.name == 'nt':
-            popen_kwargs["creationflags"] = subprocess.CREATE_NEW_CONSOLE
-
+        popen_kwargs.update(_popen_console)
         popen_kwargs.update(_popen_redirect)
 
         return super().start(popen_args, popen_kwargs)
@@ -292,21 +326,29 @@ class ServerProcess(PythonProcess):
         super().start(args)
         self._test_connect(timeout=4)
 
-    def _test_connect(self, timeout: float = 0.0):
-        waited = 0.0
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        try:
-            sock.connect((self.host, self.port))
-        except ConnectionRefusedError as e:
-            if timeout is None:
-                raise
-            if waited >= timeout:
-                message = f"Cannot connect to broadcaster at {self.host}{self.port} after {waited} seconds.\n"
-                f"Exception: {e!r}\n"
-                f"Command line was: {self.command_line}"
-                raise RuntimeError(message)
-            delay = 0.2
-            time.sleep(delay)
-            waited += delay
-        finally:
-            sock.close()
+    def _test_connect(self, timeout: Optional[float] = 0.0):
+        """
+        Check that the broadcaster accepts connections.
+
+        With timeout None, raise ConnectionRefusedError on the first failure, otherwise retry until timeout
+        """
+        start = time.monotonic()
+        while True:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            try:
+                sock.connect((self.host, self.port))
+                return
+            except ConnectionRefusedError as e:
+                if timeout is None:
+                    raise
+                waited = time.monotonic() - start
+                if waited >= timeout:
+                    message = (
+                        f"Cannot connect to broadcaster at {self.host}:{self.port} after {waited:.1f} seconds.\n"
+                        f"Exception: {e!r}\n"
+                        f"Command line was: {self.command_line}"
+                    )
+                    raise RuntimeError(message) from None
+                time.sleep(0.05)
+            finally:
+                sock.close()
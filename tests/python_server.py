@@ -39,8 +39,8 @@ async def exec_buffer(reader: asyncio.StreamReader, writer: asyncio.StreamWriter
             break
         addr = writer.get_extra_info("peername")
         logger.debug("-- Received %s bytes from %s", len(buffer), addr)
-        logger.debug(buffer.decode("utf-8"))
         buffer_string = buffer.decode("utf-8")
+        logger.debug("%s", buffer_string)
         try:
             code = compile(buffer_string, "<string>", "exec")
             share_data.pending_test_update = True
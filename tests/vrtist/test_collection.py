@@ -3,6 +3,7 @@ import unittest
 from parameterized import parameterized_class
 
 from tests import files_folder
+import tests.blender_lib as bl
 from tests.mixer_testcase import BlenderDesc
 from tests.vrtist.vrtist_testcase import VRtistTestCase
 
@@ -78,6 +79,21 @@ class TestCollection(VRtistTestCase):
         self.link_object_to_collection("C2", "OO")
         self.assert_matches()
 
+    def test_create_collection_hierarchy_in_one_update(self):
+        # the collections and their links are all processed in the same depsgraph update
+        self.bulk_scene_ops(
+            [
+                (bl.new_collection, "C1"),
+                (bl.new_collection, "C2"),
+                (bl.link_collection_to_collection, "Collection", "C1"),
+                (bl.link_collection_to_collection, "C1", "C2"),
+                (bl.new_object, "OO"),
+                (bl.link_object_to_collection, "C1", "OO"),
+                (bl.link_object_to_collection, "C2", "OO"),
+            ]
+        )
+        self.assert_matches()
+
     def test_remove_object_from_collection(self):
         self.create_collection_in_collection("Collection", "sub_collection_1")
         self.create_object_in_collection("Collection", "new_object_0_0")
@@ -17,6 +17,11 @@ import tests.blender_snippets as bl
 from tests.blender.blender_testcase import BlenderTestCase
 from tests.mixer_testcase import BlenderDesc
 
+_cleanup_scenes = """
+import bpy
+bpy.data.scenes.remove(bpy.data.scenes["Scene.001"])
+"""
+
 
 class ThrottledTestCase(BlenderTestCase):
     def setUp(self, startup_file: str = "file2.blend"):
@@ -125,11 +130,7 @@ class TestCollectionInMasterRename(ThrottledTestCase):
 
         # work around the ADD_OBJECT_TO_VRTIST mismatch that is caused because the message generation depends on the
         # active scene. So leave only one scene
-        cleanup_scenes = """
-import bpy
-bpy.data.scenes.remove(bpy.data.scenes["Scene.001"])
-"""
-        self.send_string(cleanup_scenes, to=0)
+        self.send_string(_cleanup_scenes, to=0)
 
     def send_string(self, s: str, to: int, sleep=0):
         super().send_string(s, to=to, sleep=sleep)
@@ -237,11 +238,7 @@ class TestObjectRenameGeneric(ThrottledTestCase):
 
         # work around the ADD_OBJECT_TO_VRTIST mismatch that is caused because the message generation depends on the
         # active scene. So leave only one scene
-        cleanup_scenes = """
-import bpy
-bpy.data.scenes.remove(bpy.data.scenes["Scene.001"])
-"""
-        self.send_string(cleanup_scenes, to=0)
+        self.send_string(_cleanup_scenes, to=0)
 
     def test_update_object(self):
         rename = """
@@ -267,11 +264,7 @@ class TestSceneRenameGeneric(ThrottledTestCase):
 
         # work around the ADD_OBJECT_TO_VRTIST mismatch that is caused because the message generation depends on the
         # active scene. So leave only one scene
-        cleanup_scenes = """
-import bpy
-bpy.data.scenes.remove(bpy.data.scenes["Scene.001"])
-"""
-        self.send_string(cleanup_scenes, to=0)
+        self.send_string(_cleanup_scenes, to=0)
 
     def test_add_object(self):
         self.send_strings([bl.active_layer_master_collection(), bl.ops_objects_light_add()], to=0)
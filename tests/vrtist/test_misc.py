@@ -9,6 +9,16 @@ from tests.vrtist.vrtist_testcase import VRtistTestCase
 from tests.mixer_testcase import BlenderDesc
 from tests import blender_snippets as bl
 
+# shared by the TestSetDatablockRef tests
+_create_obj0_obj1 = """
+import bpy
+scene = bpy.data.scenes[0]
+obj0 = bpy.data.objects.new("obj0", None)
+obj1 = bpy.data.objects.new("obj1", None)
+scene.collection.objects.link(obj0)
+scene.collection.objects.link(obj1)
+"""
+
 
 class MiscTestCase(VRtistTestCase):
     def setUp(self):
@@ -123,27 +133,6 @@ b.children.link(c)
         pass
 
 
-@parameterized_class(
-    [{"vrtist_protocol": False}],
-    class_name_func=VRtistTestCase.get_class_name,
-)
-class TestRenameDatablock(MiscTestCase):
-    """
-    Rename datablock referenced by Object.data
-    """
-
-    def test_light(self):
-        # Rename the light datablock
-        if self.vrtist_protocol:
-            raise unittest.SkipTest("Broken in VRtist-only")
-
-        self.send_strings([bl.ops_objects_light_add("POINT")], to=0)
-        self.send_strings([bl.data_lights_rename("Point", "__Point")], to=0)
-        self.send_strings([bl.data_lights_update("__Point", ".energy = 0")], to=0)
-
-        self.assert_matches()
-
-
 @parameterized_class(
     [{"vrtist_protocol": False}, {"vrtist_protocol": True}],
     class_name_func=VRtistTestCase.get_class_name,
@@ -186,16 +175,7 @@ coll0.children.link(coll2)
         self.assert_matches()
 
     def test_set_datablock_ref_from_none(self):
-        # 3 empties or which the creation order is not the parent order
-        create = """
-import bpy
-scene = bpy.data.scenes[0]
-obj0 = bpy.data.objects.new("obj0", None)
-obj1 = bpy.data.objects.new("obj1", None)
-scene.collection.objects.link(obj0)
-scene.collection.objects.link(obj1)
-"""
-        self.send_string(create, to=0)
+        self.send_string(_create_obj0_obj1, to=0)
 
         set_parent = """
 import bpy
@@ -213,16 +193,7 @@ obj0.parent = obj1
         if self.vrtist_protocol:
             raise unittest.SkipTest("Broken in VRtist-only")
 
-        create = """
-import bpy
-scene = bpy.data.scenes[0]
-obj0 = bpy.data.objects.new("obj0", None)
-obj1 = bpy.data.objects.new("obj1", None)
-scene.collection.objects.link(obj0)
-scene.collection.objects.link(obj1)
-obj0.parent = obj1
-"""
-        self.send_string(create, to=0)
+        self.send_strings([_create_obj0_obj1, "obj0.parent = obj1"], to=0)
 
         remove_parent = """
 import bpy
@@ -3,6 +3,7 @@ Test case for the VRTist protocol
 """
 import logging
 import sys
+from typing import Any, List, Tuple
 
 import tests.blender_lib as bl
 from tests.mixer_testcase import MixerTestCase
@@ -51,6 +52,15 @@ bpy.data.scenes[0].collection.objects.link(o)
         self.flush_collections()
         self.assert_matches()
 
+    def bulk_scene_ops(self, ops: List[Tuple[Any, ...]]):
+        """
+        Execute several blender_lib functions in the sender with a single script.
+
+        Each item of ops is a tuple (function, *args), for instance (bl.new_collection, "C1").
+        All the operations are processed in the same depsgraph update.
+        """
+        self._sender.send_functions(ops)
+
     def link_collection_to_collection(self, parent_name: str, child_name: str):
         self._sender.send_function(bl.link_collection_to_collection, parent_name, child_name)
 